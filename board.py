@@ -2,11 +2,14 @@
 # board.py
 
 import string  # Add this import
+from functools import reduce
+from operator import or_, xor
+from types import MappingProxyType
 from hex import Hex, hex_directions
-from piece import Piece
+from piece import make_piece, piece_code
 from piece_moves import * # Import all piece movement functions
-from copy import deepcopy
 from utils import format_piece, HEX_BORDERS, EMPTY_CELL, ASCII_EMPTY_CELL, get_cell_width, ROW_INDENT
+from transposition import TranspositionTable, ZOBRIST, ZOBRIST_SIDE
 
 PIECE_VALUES = {
     "P": 1,  # Pawn
@@ -26,10 +29,69 @@ UNIT_VECTORS = {
     "NW": (-1, 0, 1),  # North-West
 }
 
+OPPONENT = {"white": "black", "black": "white"}  # Color flip as a single lookup
+
 CENTER_BONUS = 0.1  # Bonus points per step closer to the center
-MOBILITY_BONUS = 0.05  # Bonus points per legal move
+MOBILITY_BONUS = 0.05  # Bonus points per pseudo-legal move
 KING_EXPOSURE_PENALTY = 0.5  # Penalty points per missing friendly piece around the king
 
+# Initial Gliński setup for the radius 5 board as (hex, piece type, color)
+INITIAL_SETUP = (
+    # White center bishop row from South corner
+    (Hex(0, -5, 5), "B", "white"),  # Bishop
+    (Hex(0, -4, 4), "B", "white"),  # Bishop
+    (Hex(0, -3, 3), "B", "white"),  # Bishop
+
+    # White left back row
+    (Hex(-1, -4, 5), "Q", "white"), # Queen
+    (Hex(-2, -3, 5), "N", "white"), # Knight
+    (Hex(-3, -2, 5), "R", "white"), # Rook
+
+    # White right back row
+    (Hex(1, -5, 4), "K", "white"),  # King
+    (Hex(2, -5, 3), "N", "white"),  # Knight
+    (Hex(3, -5, 2), "R", "white"),  # Rook
+
+    # White pawns from left to right
+    (Hex(-4, -1, 5), "P", "white"), # Pawn
+    (Hex(-3, -1, 4), "P", "white"), # Pawn
+    (Hex(-2, -1, 3), "P", "white"), # Pawn
+    (Hex(-1, -1, 2), "P", "white"), # Pawn
+    (Hex(0, -1, 1), "P", "white"),  # Pawn
+    (Hex(1, -2, 1), "P", "white"),  # Pawn
+    (Hex(2, -3, 1), "P", "white"),  # Pawn
+    (Hex(3, -4, 1), "P", "white"),  # Pawn
+    (Hex(4, -5, 1), "P", "white"),  # Pawn
+
+    # Black pieces mirrored across the center
+    (Hex(0, 5, -5), "B", "black"),  # Bishop
+    (Hex(0, 4, -4), "B", "black"),  # Bishop
+    (Hex(0, 3, -3), "B", "black"),  # Bishop
+
+    (Hex(-1, 5, -4), "Q", "black"), # Queen
+    (Hex(-2, 5, -3), "N", "black"), # Knight
+    (Hex(-3, 5, -2), "R", "black"), # Rook
+
+    (Hex(1, 4, -5), "K", "black"),  # King
+    (Hex(2, 3, -5), "N", "black"),  # Knight
+    (Hex(3, 2, -5), "R", "black"),  # Rook
+
+    (Hex(-4, 5, -1), "P", "black"), # Pawn
+    (Hex(-3, 4, -1), "P", "black"), # Pawn
+    (Hex(-2, 3, -1), "P", "black"), # Pawn
+    (Hex(-1, 2, -1), "P", "black"), # Pawn
+    (Hex(0, 1, -1), "P", "black"),  # Pawn
+    (Hex(1, 1, -2), "P", "black"),  # Pawn
+    (Hex(2, 1, -3), "P", "black"),  # Pawn
+    (Hex(3, 1, -4), "P", "black"),  # Pawn
+    (Hex(4, 1, -5), "P", "black"),  # Pawn
+)
+INITIAL_KING_POSITIONS = {
+    color: hex for hex, piece_type, color in INITIAL_SETUP if piece_type == "K"
+}
+INITIAL_HASH = reduce(xor, (ZOBRIST[(hex, piece_type, color, False)]
+                            for hex, piece_type, color in INITIAL_SETUP))
+
 class Board:
     """
     Represents the game board and manages game state.
@@ -37,38 +99,33 @@ class Board:
     BOARD_RADIUS = 5  # Distance from center (0,0,0) to edge
 
     # Attack direction constants
+    # Offsets from an attacked hex back to the pawns of each color that
+    # attack it: the reverse of PAWN_CAPTURE_DIRECTIONS
     PAWN_ATTACKS = {
-        "white": [hex_directions[0], hex_directions[5]],  # NE, NW
-        "black": [hex_directions[3], hex_directions[4]],  # SW, SE
+        color: tuple(tuple(-c for c in direction) for direction in directions)
+        for color, directions in PAWN_CAPTURE_DIRECTIONS.items()
     }
     
-    ROOK_DIRECTIONS = set(hex_directions)  # All 6 primary directions
-    hex_bishop_directions = [
-        (hex_directions[0][0] + hex_directions[1][0], hex_directions[0][1] + hex_directions[1][1], hex_directions[0][2] + hex_directions[1][2]),  # NE + N  = NNE
-        (hex_directions[1][0] + hex_directions[2][0], hex_directions[1][1] + hex_directions[2][1], hex_directions[1][2] + hex_directions[2][2]),  # N  + NW = NNW
-        (hex_directions[2][0] + hex_directions[3][0], hex_directions[2][1] + hex_directions[3][1], hex_directions[2][2] + hex_directions[3][2]),  # NW + SW = W
-        (hex_directions[3][0] + hex_directions[4][0], hex_directions[3][1] + hex_directions[4][1], hex_directions[3][2] + hex_directions[4][2]),  # SW + S  = SSW
-        (hex_directions[4][0] + hex_directions[5][0], hex_directions[4][1] + hex_directions[5][1], hex_directions[4][2] + hex_directions[5][2]),  # S  + SE = SSE
-        (hex_directions[5][0] + hex_directions[0][0], hex_directions[5][1] + hex_directions[0][1], hex_directions[5][2] + hex_directions[0][2])   # SE + NE = E
-    ]    
-    BISHOP_DIRECTIONS = set(hex_bishop_directions)  # Diagonal directions between primary directions
+    ROOK_DIRECTIONS = frozenset(hex_directions)  # All 6 primary directions
+    hex_bishop_directions = list(BISHOP_DIRECTION_VECTORS)  # NNE, NNW, W, SSW, SSE, E
+    BISHOP_DIRECTIONS = frozenset(hex_bishop_directions)  # Diagonal directions between primary directions
     QUEEN_DIRECTIONS = ROOK_DIRECTIONS | BISHOP_DIRECTIONS  # Queens can move in all directions
-    
-    # Knight move patterns (hard-coded)
-    KNIGHT_PATTERNS = [
-        ((1, 0, -1), (0, 1, -1)),  # NE, N
-        ((1, 0, -1), (1, -1, 0)),  # NE, SE
-        ((0, 1, -1), (-1, 1, 0)),  # N, NW
-        ((0, 1, -1), (1, 0, -1)),  # N, NE
-        ((-1, 1, 0), (-1, 0, 1)),  # NW, SW
-        ((-1, 1, 0), (0, 1, -1)),  # NW, N
-        ((-1, 0, 1), (0, -1, 1)),  # SW, S
-        ((-1, 0, 1), (-1, 1, 0)),  # SW, NW
-        ((0, -1, 1), (1, -1, 0)),  # S, SE
-        ((0, -1, 1), (-1, 0, 1)),  # S, SW
-        ((1, -1, 0), (1, 0, -1)),  # SE, NE
-        ((1, -1, 0), (0, -1, 1)),  # SE, S
-    ]
+
+    # Piece codes that can give check, by attacking color, in is_check order
+    CHECK_CODES = {
+        color: tuple(piece_code(piece_type, color) for piece_type in "KPNRBQ")
+        for color in ("white", "black")
+    }
+
+    # Pseudo-legal move generators by piece type
+    MOVE_FUNCTIONS = {
+        "N": get_knight_moves,
+        "R": get_rook_moves,
+        "B": get_bishop_moves,
+        "Q": get_queen_moves,
+        "K": get_king_moves,
+        "P": get_pawn_moves,
+    }
 
     # Column label positions
     column_label_positions = {
@@ -104,97 +161,190 @@ class Board:
     q_labels = {q: letter for q, letter in zip(range(-5, 6), string.ascii_uppercase[:11])}
     r_labels = {r: str(r + 6) for r in range(-5, 6)}
 
+    # Transposition table shared by all boards; entries are keyed on the
+    # position hash, so they stay valid across copies and between moves
+    _tt = TranspositionTable()
+
     def __init__(self):
         """Initializes the board and sets up the pieces."""
         self.board = {}  # Dictionary: {Hex: Piece}
         self._king_positions = {"white": None, "black": None}  # Initialize before setup_board
+        self._pieces_by_color = {"white": set(), "black": set()}  # Occupied hexes per color
         self.current_player = "white"
         self.move_number = 1  # Start at move 1
         self.moves_history = []  # List of (start_hex, end_hex, move_str) tuples
+        self._hash = 0  # Zobrist hash of the position, maintained incrementally
+        self._bitboards = [0] * 14  # Occupied HEX_BIT masks indexed by piece code
+        self._occupied = 0  # Union of all piece bitboards
         self.setup_board()  # Call setup_board last
-        self._move_cache = {}  # Cache for possible moves
+        self._undo_stack = []  # Undo records for _make_move_fast/_unmake_move_fast
+        self._move_records = []  # Undo records for move_piece/undo_move, one per history entry
+
+    @classmethod
+    def _build_tables(cls):
+        """Precomputes per-hex attack tables, once, for every on-board hex.
+
+        - VALID_HEXES: frozenset of all on-board hexes.
+        - NEIGHBORS[hex]: the adjacent on-board hexes.
+        - PAWN_ATTACKERS[color][hex]: hexes from which a pawn of that color attacks hex.
+        - PAWN_PUSHES[color][hex]: the (up to two) on-board hexes straight ahead
+          of a pawn of that color, nearest first.
+        - PAWN_CAPTURES[color][hex]: on-board hexes a pawn of that color captures on.
+        - KNIGHT_TARGETS[hex]: on-board hexes a knight jump away (KNIGHT_OFFSETS).
+        - RAYS[hex]: 12 tuples of on-board hexes ordered by distance, the six
+          primary directions first, then the six diagonal directions.
+        - DIST_TO_CENTER[hex] and CENTER_BONUS_BY_HEX[hex]: the hex's distance
+          to the center and the evaluation bonus it earns.
+        - DISPLAY_ROWS: (r, hexes) pairs from top to bottom, each row's hexes
+          ordered by q as display() prints them.
+
+        Bitboard versions of the attack tables, for is_check:
+        - HEX_BIT[hex]: the hex's single bit, numbered in DISPLAY_ROWS order.
+        - KING_ZONE_BITS[hex], PAWN_ATTACKER_BITS[color][hex], KNIGHT_BITS[hex]:
+          masks of NEIGHBORS, PAWN_ATTACKERS and KNIGHT_TARGETS.
+        - ROOK_LINE_BITS[hex], BISHOP_LINE_BITS[hex]: all squares on the
+          primary, resp. diagonal, rays from hex.
+        - BETWEEN_BITS[hex][HEX_BIT[square]]: the squares strictly between hex
+          and a square on one of its rays.
+        - RAY_THROUGH[hex][square]: (mask, nearest_is_low, is_diagonal) for the
+          ray from hex through square, where nearest_is_low says whether the
+          lowest set bit of a masked occupancy is the square closest to hex.
+        """
+        radius = cls.BOARD_RADIUS
+        cells = [Hex(q, r, -q - r)
+                 for r in range(-radius, radius + 1)
+                 for q in range(-radius, radius + 1)
+                 if abs(q + r) <= radius]
+        cls.VALID_HEXES = on_board = frozenset(cells)
+
+        def ray(start, direction):
+            squares = []
+            current = start + direction
+            while current in on_board:
+                squares.append(current)
+                current = current + direction
+            return tuple(squares)
+
+        def targets(start, offsets):
+            squares = []
+            for offset in offsets:
+                target = start + offset
+                if target in on_board and target not in squares:
+                    squares.append(target)
+            return tuple(squares)
+
+        cls.NEIGHBORS = {hex: targets(hex, hex_directions) for hex in cells}
+        cls.PAWN_ATTACKERS = {
+            color: {hex: targets(hex, directions) for hex in cells}
+            for color, directions in cls.PAWN_ATTACKS.items()
+        }
+        cls.PAWN_PUSHES = {
+            color: {hex: ray(hex, forward)[:2] for hex in cells}
+            for color, forward in PAWN_FORWARD_DIRECTIONS.items()
+        }
+        cls.PAWN_CAPTURES = {
+            color: {hex: targets(hex, directions) for hex in cells}
+            for color, directions in PAWN_CAPTURE_DIRECTIONS.items()
+        }
+        cls.KNIGHT_TARGETS = {hex: targets(hex, KNIGHT_OFFSETS) for hex in cells}
+        cls.RAYS = {
+            hex: tuple(ray(hex, d) for d in hex_directions) +
+                 tuple(ray(hex, d) for d in cls.hex_bishop_directions)
+            for hex in cells
+        }
+        cls.DIST_TO_CENTER = {hex: abs(hex) for hex in cells}
+        cls.CENTER_BONUS_BY_HEX = {
+            hex: (radius - distance) * CENTER_BONUS for hex, distance in cls.DIST_TO_CENTER.items()
+        }
+        cls.DISPLAY_ROWS = tuple(
+            (r, tuple(hex for hex in cells if hex.r == r))
+            for r in range(-radius, radius + 1)
+        )
+
+        cls.HEX_BIT = {hex: 1 << index for index, hex in enumerate(cells)}
+
+        def mask(squares):
+            bits = 0
+            for square in squares:
+                bits |= cls.HEX_BIT[square]
+            return bits
+
+        def ray_runs_low(start, ray):
+            return cls.HEX_BIT[ray[0]] > cls.HEX_BIT[start]
+
+        cls.KING_ZONE_BITS = {hex: mask(squares) for hex, squares in cls.NEIGHBORS.items()}
+        cls.PAWN_ATTACKER_BITS = {
+            color: {hex: mask(squares) for hex, squares in attackers.items()}
+            for color, attackers in cls.PAWN_ATTACKERS.items()
+        }
+        cls.KNIGHT_BITS = {hex: mask(squares) for hex, squares in cls.KNIGHT_TARGETS.items()}
+        cls.ROOK_LINE_BITS = {hex: mask(sq for ray in rays[:6] for sq in ray) for hex, rays in cls.RAYS.items()}
+        cls.BISHOP_LINE_BITS = {hex: mask(sq for ray in rays[6:] for sq in ray) for hex, rays in cls.RAYS.items()}
+        cls.BETWEEN_BITS = {
+            hex: {cls.HEX_BIT[square]: mask(ray[:index])
+                  for ray in rays for index, square in enumerate(ray)}
+            for hex, rays in cls.RAYS.items()
+        }
+        cls.RAY_THROUGH = {
+            hex: {square: (mask(ray), ray_runs_low(hex, ray), index >= 6)
+                  for index, ray in enumerate(rays) for square in ray}
+            for hex, rays in cls.RAYS.items()
+        }
 
     def is_valid_hex(self, hex):
         """Checks if a hex is within the board boundaries and forms a valid hexagonal shape.
         
-        For radius 5, valid coordinates must satisfy:
-        1. -5 ≤ q,r,s ≤ 5 (within radius)
-        2. q + r + s = 0 (cubic coordinates)
-        3. max(|q|, |r|, |s|) ≤ 5 (hexagonal shape)
+        For radius 5, valid coordinates must satisfy max(|q|, |r|, |s|) ≤ 5.
+        Hex construction already enforces q + r + s = 0, so this is a plain
+        lookup in the precomputed VALID_HEXES set.
         """
-        # Check cubic coordinate constraint
-        if hex.q + hex.r + hex.s != 0:
-            return False
-            
-        # Check radius constraint
-        if (abs(hex.q) > self.BOARD_RADIUS or 
-            abs(hex.r) > self.BOARD_RADIUS or 
-            abs(hex.s) > self.BOARD_RADIUS):
-            return False
-            
-        # Check hexagonal shape using max norm
-        if max(abs(hex.q), abs(hex.r), abs(hex.s)) > self.BOARD_RADIUS:
-            return False
-            
-        return True
+        return hex in self.VALID_HEXES
 
     def setup_board(self):
         """Sets up the initial board configuration for radius 5 board."""
-        self.board = {
-            # White center bishop row from South corner
-            Hex(0, -5, 5): Piece("B", "white", Hex(0, -5, 5)),    # Bishop
-            Hex(0, -4, 4): Piece("B", "white", Hex(0, -4, 4)),    # Bishop
-            Hex(0, -3, 3): Piece("B", "white", Hex(0, -3, 3)),    # Bishop
-
-            # White left back row
-            Hex(-1, -4, 5): Piece("Q", "white", Hex(-1, -4, 5)),  # Queen
-            Hex(-2, -3, 5): Piece("N", "white", Hex(-2, -3, 5)),  # Knight
-            Hex(-3, -2, 5): Piece("R", "white", Hex(-3, -2, 5)),  # Rook
-            
-            # White right back row
-            Hex(1, -5, 4): Piece("K", "white", Hex(1, -5, 4)),    # King
-            Hex(2, -5, 3): Piece("N", "white", Hex(2, -5, 3)),    # Knight
-            Hex(3, -5, 2): Piece("R", "white", Hex(3, -5, 2)),    # Rook
-
-            # White pawns from left to right
-            Hex(-4, -1, 5): Piece("P", "white", Hex(-4, -1, 5)),  # Pawn
-            Hex(-3, -1, 4): Piece("P", "white", Hex(-3, -1, 4)),  # Pawn
-            Hex(-2, -1, 3): Piece("P", "white", Hex(-2, -1, 3)),  # Pawn
-            Hex(-1, -1, 2): Piece("P", "white", Hex(-1, -1, 2)),  # Pawn
-            Hex(0, -1, 1): Piece("P", "white", Hex(0, -1, 1)),    # Pawn
-            Hex(1, -2, 1): Piece("P", "white", Hex(1, -2, 1)),    # Pawn
-            Hex(2, -3, 1): Piece("P", "white", Hex(2, -3, 1)),    # Pawn
-            Hex(3, -4, 1): Piece("P", "white", Hex(3, -4, 1)),    # Pawn
-            Hex(4, -5, 1): Piece("P", "white", Hex(4, -5, 1)),    # Pawn
-
-            # Black pieces mirrored across the center
-            Hex(0, 5, -5): Piece("B", "black", Hex(0, 5, -5)),    # Bishop
-            Hex(0, 4, -4): Piece("B", "black", Hex(0, 4, -4)),    # Bishop
-            Hex(0, 3, -3): Piece("B", "black", Hex(0, 3, -3)),    # Bishop
-
-            Hex(-1, 5, -4): Piece("Q", "black", Hex(-1, 5, -4)),  # Queen
-            Hex(-2, 5, -3): Piece("N", "black", Hex(-2, 5, -3)),  # Knight
-            Hex(-3, 5, -2): Piece("R", "black", Hex(-3, 5, -2)),  # Rook
-
-            Hex(1, 4, -5): Piece("K", "black", Hex(1, 4, -5)),    # King
-            Hex(2, 3, -5): Piece("N", "black", Hex(2, 3, -5)),    # Knight
-            Hex(3, 2, -5): Piece("R", "black", Hex(3, 2, -5)),    # Rook
-
-            Hex(-4, 5, -1): Piece("P", "black", Hex(-4, 5, -1)),  # Pawn
-            Hex(-3, 4, -1): Piece("P", "black", Hex(-3, 4, -1)),  # Pawn
-            Hex(-2, 3, -1): Piece("P", "black", Hex(-2, 3, -1)),  # Pawn
-            Hex(-1, 2, -1): Piece("P", "black", Hex(-1, 2, -1)),  # Pawn
-            Hex(0, 1, -1): Piece("P", "black", Hex(0, 1, -1)),    # Pawn
-            Hex(1, 1, -2): Piece("P", "black", Hex(1, 1, -2)),    # Pawn
-            Hex(2, 1, -3): Piece("P", "black", Hex(2, 1, -3)),    # Pawn
-            Hex(3, 1, -4): Piece("P", "black", Hex(3, 1, -4)),    # Pawn
-            Hex(4, 1, -5): Piece("P", "black", Hex(4, 1, -5)),    # Pawn
-        }
-        
-        # Initialize king position cache
+        self.board = {hex: make_piece(piece_type, color, hex) for hex, piece_type, color in INITIAL_SETUP}
+        self._king_positions = dict(INITIAL_KING_POSITIONS)
+        self._pieces_by_color = {"white": set(), "black": set()}
         for hex, piece in self.board.items():
-            if piece.type == "K":
-                self._king_positions[piece.color] = hex
+            self._pieces_by_color[piece.color].add(hex)
+        self._hash = INITIAL_HASH ^ (ZOBRIST_SIDE if self.current_player == "black" else 0)
+        self._bitboards = [0] * 14
+        for hex, piece in self.board.items():
+            self._bitboards[piece.code] |= self.HEX_BIT[hex]
+        self._occupied = reduce(or_, self._bitboards)
+
+    @staticmethod
+    def _piece_hash(hex, piece):
+        """Returns the Zobrist key of a piece standing on a hex."""
+        return ZOBRIST[(hex, piece.type, piece.color, piece.has_moved)]
+
+    def _color_bits(self, color):
+        """Returns the bitboard of all squares holding a piece of the given color."""
+        bits = self._bitboards
+        occupied = 0
+        for code in self.CHECK_CODES[color]:
+            occupied |= bits[code]
+        return occupied
+
+    def _xor_move_bits(self, piece, start_hex, end_hex, captured):
+        """Toggles a move's squares in the bitboards; a second call reverts it."""
+        start_bit = self.HEX_BIT[start_hex]
+        end_bit = self.HEX_BIT[end_hex]
+        bits = self._bitboards
+        bits[piece.code] ^= start_bit | end_bit
+        if captured is not None:
+            bits[captured.code] ^= end_bit
+            self._occupied ^= start_bit
+        else:
+            self._occupied ^= start_bit | end_bit
+
+    def _move_color_hex(self, piece, start_hex, end_hex, captured=None):
+        """Moves a piece's hex between squares in the per-color hex sets."""
+        own = self._pieces_by_color[piece.color]
+        own.remove(start_hex)
+        own.add(end_hex)
+        if captured is not None:
+            self._pieces_by_color[captured.color].remove(end_hex)
 
     def is_occupied(self, hex):
         """Checks if a hex is occupied by a piece."""
@@ -210,9 +360,19 @@ class Board:
         piece = self.get_piece(start_hex)
         if piece.color != self.current_player:
             raise ValueError(f"It's {self.current_player}'s turn to move")
-
-        # Update board
-        self.board[end_hex] = self.board.pop(start_hex).move(end_hex)
+        captured = self.board.get(end_hex)
+        if captured is not None and captured.color == piece.color:
+            raise ValueError(f"Cannot capture your own piece at {end_hex}")
+
+        # Update board and position hash
+        self._move_records.append((piece, captured, self._hash, getattr(self, "_last_move", None)))
+        moved = self.board.pop(start_hex).move(end_hex)
+        self.board[end_hex] = moved
+        self._hash ^= self._piece_hash(start_hex, piece) ^ self._piece_hash(end_hex, moved) ^ ZOBRIST_SIDE
+        if captured is not None:
+            self._hash ^= self._piece_hash(end_hex, captured)
+        self._xor_move_bits(piece, start_hex, end_hex, captured)
+        self._move_color_hex(piece, start_hex, end_hex, captured)
         
         # Update king position if king moved
         if piece.type == "K":
@@ -227,7 +387,7 @@ class Board:
             self.move_number += 1
             
         # Switch current player
-        self.current_player = "black" if self.current_player == "white" else "white"
+        self.current_player = OPPONENT[self.current_player]
 
         # Handle pawn promotion
         if piece.type == "P":
@@ -235,85 +395,194 @@ class Board:
                (piece.color == "black" and end_hex.r == -self.BOARD_RADIUS):
                 self.promote_pawn(end_hex, "Q")
 
-        # Clear the move cache after a move
-        self._move_cache.clear()
         self._last_move = (start_hex, end_hex)
 
+    def undo_move(self):
+        """Takes back the last move made with move_piece, including any promotion.
+
+        Raises:
+            ValueError: If no move has been made
+        """
+        if not self._move_records:
+            raise ValueError("No move to undo")
+
+        piece, captured, self._hash, self._last_move = self._move_records.pop()
+        start_hex, end_hex, _ = self.moves_history.pop()
+
+        # The piece on end_hex may differ from piece after a promotion
+        current = self.board.pop(end_hex)
+        self.board[start_hex] = piece
+        start_bit = self.HEX_BIT[start_hex]
+        end_bit = self.HEX_BIT[end_hex]
+        bits = self._bitboards
+        bits[current.code] ^= end_bit
+        bits[piece.code] ^= start_bit
+        self._occupied |= start_bit
+        if captured is not None:
+            self.board[end_hex] = captured
+            bits[captured.code] ^= end_bit
+        else:
+            self._occupied ^= end_bit
+        self._move_color_hex(piece, end_hex, start_hex)
+        if captured is not None:
+            self._pieces_by_color[captured.color].add(end_hex)
+
+        if piece.type == "K":
+            self._king_positions[piece.color] = start_hex
+
+        self.current_player = OPPONENT[self.current_player]
+        if self.current_player == "black":
+            self.move_number -= 1
+
+    def promote_pawn(self, hex, new_type):
+        """Promotes the pawn at the given hex to a new piece type."""
+        piece = self.get_piece(hex)
+        if piece is None or piece.type != "P":
+            raise ValueError("No pawn to promote at given hex")
+
+        if new_type not in ("R", "N", "B", "Q"):
+            raise ValueError("Invalid promotion type")
+
+        promoted = make_piece(new_type, piece.color, hex)
+        self.board[hex] = promoted
+        self._hash ^= self._piece_hash(hex, piece) ^ self._piece_hash(hex, promoted)
+        self._bitboards[piece.code] ^= self.HEX_BIT[hex]
+        self._bitboards[promoted.code] ^= self.HEX_BIT[hex]
+
     def get_possible_moves(self, hex):
-        """Returns a set of legal moves for the piece at the given hex."""
-        if hex in self._move_cache:
-            return self._move_cache[hex]
+        """Returns a frozenset of legal moves for the piece at the given hex.
+
+        The set is cached for the position and shared between callers, so it
+        is immutable.
+        """
+        cache_key = (self._hash, "moves", hex)
+        cached = self._tt.get(cache_key)
+        if cached is not None:
+            return cached
 
         # print(f"Getting possible moves for piece at {hex}")  # Debug line
         piece = self.get_piece(hex)
         if piece is None or piece.color != self.current_player:
-            return set()
-
-        move_functions = {
-            "N": get_knight_moves,
-            "R": get_rook_moves,
-            "B": get_bishop_moves,
-            "Q": get_queen_moves,
-            "K": get_king_moves,
-            "P": get_pawn_moves,
-        }
-        if piece.type not in move_functions:
-            return set()
-        all_moves = move_functions[piece.type](self, piece)
-        legal_moves = set()
-        for move in all_moves:
-            temp_board = deepcopy(self)
-            temp_board.move_piece(hex, move)
-            if not temp_board.is_check(self.current_player):
-                legal_moves.add(move)
+            return frozenset()
 
-        self._move_cache[hex] = legal_moves
+        legal_moves = self._legalize(self._pseudo_moves(piece), hex)
+        self._tt.store(cache_key, legal_moves)
         return legal_moves
 
-    def has_position_changed(self, hex):
-        """Check if the position of the piece at the given hex has changed."""
-        last_move = self._last_move if hasattr(self, '_last_move') else None
-        return last_move and (hex == last_move[0] or hex == last_move[1])
+    def get_all_possible_moves(self):
+        """Returns the legal moves of every piece of the side to move.
 
-    def get_pawn_moves(self, piece):
-        """Calculate all valid moves for a pawn.
-        
-        Pawns move forward one step (or two on first move) and capture
-        diagonally forward.
-        
-        Args:
-            board: The game board
-            piece: The pawn piece to move
-            
-        Returns:
-            set: Valid destination hexes for the pawn
-        """
-        # print(f"Calculating pawn moves for piece at {piece.position}")  # Debug line
-        moves = set()
-        forward = hex_directions[0] if piece.color == "white" else hex_directions[3]
-        one_step = piece.position + forward  # Using __add__
-        # print(f"Checking one step move {one_step} from {piece.position} using direction {forward}")  # Debug line
+        The result is cached for the position, so repeated queries between
+        moves (checkmate test, move hints, AI) generate moves only once.
 
-        if self.is_valid_hex(one_step) and not self.is_occupied(one_step):
-            moves.add(one_step)
+        The mapping is shared through the cache, so it is read-only, like
+        the move sets in it.
 
-            # Double first move
-            if not piece.has_moved:
-                two_step = one_step + forward  # Using __add__
-                # print(f"Checking two step move {two_step} from {one_step} using direction {forward}")  # Debug line
-                if self.is_valid_hex(two_step) and not self.is_occupied(two_step):
-                    moves.add(two_step)
+        Returns:
+            Mapping: {Hex: frozenset of destination hexes} for each of the player's pieces
+        """
+        cache_key = (self._hash, "all_moves")
+        cached = self._tt.get(cache_key)
+        if cached is not None:
+            return cached
+
+        color = self.current_player
+        all_moves = MappingProxyType({hex: self.get_possible_moves(hex)
+                                      for hex in list(self._pieces_by_color[color])})
+        self._tt.store(cache_key, all_moves)
+        return all_moves
+
+    def _pseudo_moves(self, piece):
+        """Returns the piece's moves without checking whether they leave its king in check."""
+        move_function = self.MOVE_FUNCTIONS.get(piece.type)
+        if move_function is None:
+            return []
+        return move_function(self, piece)
+
+    def _legalize(self, moves, from_hex):
+        """Filters moves from a hex down to those that do not leave the mover in check.
+
+        When the mover is not in check and is not moving the king, a move can
+        only expose the king along the ray through the vacated hex, so just
+        that ray is scanned instead of making each move and calling is_check.
+        """
+        color = self.current_player
+        king_pos = self._king_positions.get(color)
+        if king_pos is None or king_pos == from_hex or self.is_check(color):
+            legal_moves = set()
+            for move in moves:
+                self._make_move_fast(from_hex, move)
+                in_check = self._is_check_uncached(color)  # Throwaway position, keep it out of the table
+                self._unmake_move_fast()
+                if not in_check:
+                    legal_moves.add(move)
+            return frozenset(legal_moves)
+
+        line = self.RAY_THROUGH[king_pos].get(from_hex)
+        if line is None:
+            return frozenset(moves)  # Not on a line to the king: nothing can be uncovered
+
+        ray_mask, nearest_is_low, diagonal = line
+        king, pawn, knight, rook, bishop, queen = self.CHECK_CODES[OPPONENT[color]]
+        bits = self._bitboards
+        sliders = ray_mask & (bits[queen] | bits[bishop if diagonal else rook])
+        if not sliders:
+            return frozenset(moves)  # No attacker on that line at all
+
+        hex_bit = self.HEX_BIT
+        vacated = self._occupied & ~hex_bit[from_hex]
+        legal_moves = set()
+        for move in moves:
+            move_bit = hex_bit[move]
+            blockers = ray_mask & (vacated | move_bit)
+            if nearest_is_low:
+                nearest = blockers & -blockers
+            else:
+                nearest = 1 << (blockers.bit_length() - 1)
+            # Safe if the moved piece lands first on the line, possibly capturing
+            if nearest == move_bit or not nearest & sliders:
+                legal_moves.add(move)
+        return frozenset(legal_moves)
 
-        # Captures
-        capture_left = piece.position + (hex_directions[5] if piece.color == "white" else hex_directions[2])  # Using __add__
-        capture_right = piece.position + (hex_directions[1] if piece.color == "white" else hex_directions[4])  # Using __add__
-        # print(f"Checking capture moves {capture_left} and {capture_right} from {piece.position}")  # Debug line
+    def _make_move_fast(self, start_hex, end_hex):
+        """Applies a move in place for legality testing, without side effects.
 
-        for capture_move in [capture_left, capture_right]:
-            if self.is_valid_hex(capture_move) and self.is_occupied(capture_move) and self.get_piece(capture_move).color != piece.color:
-                moves.add(capture_move)
+        Only the board, bitboards, king position cache, position hash and
+        current player are updated; move history, notation and promotion are left alone.
+        Every call must be paired with `_unmake_move_fast`.
+        """
+        piece = self.board.pop(start_hex)
+        captured = self.board.get(end_hex)
+        self._undo_stack.append((start_hex, end_hex, captured,
+                                 self._king_positions[piece.color], self._hash))
+        self.board[end_hex] = piece
+        self._hash ^= self._piece_hash(start_hex, piece) ^ self._piece_hash(end_hex, piece) ^ ZOBRIST_SIDE
+        if captured is not None:
+            self._hash ^= self._piece_hash(end_hex, captured)
+        self._xor_move_bits(piece, start_hex, end_hex, captured)
+        self._move_color_hex(piece, start_hex, end_hex, captured)
+        if piece.type == "K":
+            self._king_positions[piece.color] = end_hex
+        self.current_player = OPPONENT[self.current_player]
+
+    def _unmake_move_fast(self):
+        """Reverts the most recent `_make_move_fast` call."""
+        start_hex, end_hex, captured, king_pos, self._hash = self._undo_stack.pop()
+        piece = self.board.pop(end_hex)
+        self.board[start_hex] = piece
+        if captured is not None:
+            self.board[end_hex] = captured
+        self._xor_move_bits(piece, start_hex, end_hex, captured)
+        self._move_color_hex(piece, end_hex, start_hex)
+        if captured is not None:
+            self._pieces_by_color[captured.color].add(end_hex)
+        self._king_positions[piece.color] = king_pos
+        self.current_player = OPPONENT[self.current_player]
 
-        return moves
+    def has_position_changed(self, hex):
+        """Check if the position of the piece at the given hex has changed."""
+        last_move = self._last_move if hasattr(self, '_last_move') else None
+        return last_move and (hex == last_move[0] or hex == last_move[1])
 
     def is_check(self, color: str) -> bool:
         """Checks if the given color's king is in check.
@@ -327,65 +596,49 @@ class Board:
         Returns:
             bool: True if king is in check, False otherwise
         """
+        cache_key = (self._hash, "check", color)
+        cached = self._tt.get(cache_key)
+        if cached is not None:
+            return cached
+        in_check = self._is_check_uncached(color)
+        self._tt.store(cache_key, in_check)
+        return in_check
+
+    def _is_check_uncached(self, color):
+        """Computes `is_check` without consulting the transposition table."""
+        return bool(self._checkers(color))
+
+    def _checkers(self, color):
+        """Returns the bitboard of opponent pieces giving check to color's king.
+
+        Returns 0 when the king is not in check or there is no such king.
+        """
         king_pos = self._king_positions.get(color)
         if not king_pos:
-            return False
-
-        opponent = "black" if color == "white" else "white"
-        
-        # Check nearby squares for enemy king
-        for direction in hex_directions:
-            adjacent = king_pos + direction
-            if (self.is_valid_hex(adjacent) and 
-                (piece := self.get_piece(adjacent)) and 
-                piece.type == "K" and piece.color == opponent):
-                return True
-
-        # Check pawn attacks
-        for direction in self.PAWN_ATTACKS[opponent]:
-            attack_pos = king_pos + direction
-            if (self.is_valid_hex(attack_pos) and 
-                (piece := self.get_piece(attack_pos)) and 
-                piece.type == "P" and piece.color == opponent):
-                return True
-
-        # Check knight attacks using precomputed patterns
-        for d1, d2 in self.KNIGHT_PATTERNS:
-            attack_pos = king_pos + d1 + d2
-            if (self.is_valid_hex(attack_pos) and 
-                (piece := self.get_piece(attack_pos)) and 
-                piece.type == "N" and piece.color == opponent):
-                return True
-
-        # Check sliding pieces (rooks and queens along primary directions)
-        for direction in hex_directions:
-            current = king_pos
-            while True:
-                current = current + direction
-                if not self.is_valid_hex(current):
-                    break
-                    
-                if piece := self.get_piece(current):
-                    if piece.color == opponent:
-                        if piece.type == "Q" or piece.type == "R":
-                            return True
-                    break  # Blocked by any piece
-
-        # Check sliding pieces (bishops and queens along diagonal directions)
-        for direction in self.BISHOP_DIRECTIONS:
-            current = king_pos
-            while True:
-                current = current + direction
-                if not self.is_valid_hex(current):
-                    break
-                    
-                if piece := self.get_piece(current):
-                    if piece.color == opponent:
-                        if piece.type == "Q" or piece.type == "B":
-                            return True
-                    break  # Blocked by any piece
-                
-        return False
+            return 0
+
+        opponent = OPPONENT[color]
+        king, pawn, knight, rook, bishop, queen = self.CHECK_CODES[opponent]
+        bits = self._bitboards
+
+        # The leapers are a single mask test each
+        checkers = (self.KING_ZONE_BITS[king_pos] & bits[king]
+                    | self.PAWN_ATTACKER_BITS[opponent][king_pos] & bits[pawn]
+                    | self.KNIGHT_BITS[king_pos] & bits[knight])
+
+        # Sliders: only the ones standing on a line through the king matter
+        aligned = (self.ROOK_LINE_BITS[king_pos] & (bits[rook] | bits[queen]) |
+                   self.BISHOP_LINE_BITS[king_pos] & (bits[bishop] | bits[queen]))
+        if aligned:
+            between = self.BETWEEN_BITS[king_pos]
+            occupied = self._occupied
+            while aligned:
+                slider = aligned & -aligned  # Lowest remaining aligned slider
+                if not between[slider] & occupied:
+                    checkers |= slider
+                aligned ^= slider
+
+        return checkers
 
     def is_checkmate(self, color):
         """Checks if the given color's king is checkmated.
@@ -407,23 +660,28 @@ class Board:
         if not self.is_check(color):
             return False
 
-        for hex, piece in self.board.items():
-            if piece.color == color:
-                for move in self.get_possible_moves(hex):
-                    # Create a deep copy of the board to test moves
-                    temp_board = deepcopy(self)
-                    temp_board.move_piece(piece.position, move)
-                    if not temp_board.is_check(color):
-                        return False
+        if color != self.current_player:
+            return True  # Only the side to move has legal moves
+
+        # Legal moves already exclude those that leave the king in check,
+        # so any remaining move escapes. Try the king first: stepping away
+        # is the most common escape and the cheapest to generate.
+        if self.get_possible_moves(self._king_positions[color]):
+            return False
+
+        # In double check no block or capture can deal with both checkers
+        checkers = self._checkers(color)
+        if checkers & (checkers - 1):
+            return True
 
-        return True
+        return not any(self.get_all_possible_moves().values())
 
     def evaluate_position(self) -> int:
         """Evaluates the board position based on several factors:
         
         - Piece values: Each piece type has a specific value (e.g., pawn = 1, queen = 9).
         - Proximity to the center: Pieces closer to the center receive bonus points.
-        - Mobility: The number of legal moves available for each piece.
+        - Mobility: The number of pseudo-legal moves available for each piece.
         - King exposure: Penalty points for each missing friendly piece around the king.
         
         The evaluation score is positive if the current player has an advantage,
@@ -432,60 +690,41 @@ class Board:
         Returns:
             int: The evaluation score (positive for current player, negative for opponent).
         """
-        score = 0
-        center = Hex(0, 0, 0)
-        for hex, piece in self.board.items():
-            value = PIECE_VALUES[piece.type]
-            distance_to_center = abs(hex - center)
-            center_bonus = (self.BOARD_RADIUS - distance_to_center) * CENTER_BONUS
-            mobility_bonus = len(self.get_possible_moves(hex)) * MOBILITY_BONUS
-            king_exposure_penalty = 0
-
-            if piece.type == "K":
-                friendly_pieces_nearby = 0
-                for direction in hex_directions:
-                    adjacent = hex + direction
-                    if self.is_valid_hex(adjacent):
-                        adjacent_piece = self.get_piece(adjacent)
-                        if adjacent_piece and adjacent_piece.color == piece.color:
-                            friendly_pieces_nearby += 1
-                king_exposure_penalty = (6 - friendly_pieces_nearby) * KING_EXPOSURE_PENALTY
-
-            if piece.color == self.current_player:
-                score += value + center_bonus + mobility_bonus - king_exposure_penalty
-            else:
-                score -= value + center_bonus + mobility_bonus - king_exposure_penalty
-
-        return score
+        return self._evaluate_core(self.current_player)
 
     def evaluate_position_for(self, player_color: str) -> float:
         """Evaluates the board position from a specific player's perspective."""
+        # Round to 2 decimal places; adding 0.0 turns a rounded -0.0 into 0.0
+        return round(self._evaluate_core(player_color), 2) + 0.0
+
+    def _evaluate_core(self, perspective_color):
+        """Scores the position for perspective_color; shared by both evaluate methods."""
+        cache_key = (self._hash, "eval", perspective_color)
+        cached = self._tt.get(cache_key)
+        if cached is not None:
+            return cached
+
+        board = self.board
         score = 0
-        center = Hex(0, 0, 0)
-        for hex, piece in self.board.items():
+        for hex, piece in board.items():
             value = PIECE_VALUES[piece.type]
-            distance_to_center = abs(hex - center)
-            center_bonus = (self.BOARD_RADIUS - distance_to_center) * CENTER_BONUS
-            mobility_bonus = len(self.get_possible_moves(hex)) * MOBILITY_BONUS
+            center_bonus = self.CENTER_BONUS_BY_HEX[hex]
+            mobility_bonus = len(self._pseudo_moves(piece)) * MOBILITY_BONUS
             king_exposure_penalty = 0
 
             if piece.type == "K":
-                friendly_pieces_nearby = 0
-                for direction in hex_directions:
-                    adjacent = hex + direction
-                    if self.is_valid_hex(adjacent):
-                        adjacent_piece = self.get_piece(adjacent)
-                        if adjacent_piece and adjacent_piece.color == piece.color:
-                            friendly_pieces_nearby += 1
+                friendly = self.KING_ZONE_BITS[hex] & self._color_bits(piece.color)
+                friendly_pieces_nearby = bin(friendly).count("1")
                 king_exposure_penalty = (6 - friendly_pieces_nearby) * KING_EXPOSURE_PENALTY
 
-        piece_score = value + center_bonus + mobility_bonus - king_exposure_penalty
-        if piece.color == player_color:
-            score += piece_score
-        else:
-            score -= piece_score
+            piece_score = value + center_bonus + mobility_bonus - king_exposure_penalty
+            if piece.color == perspective_color:
+                score += piece_score
+            else:
+                score -= piece_score
 
-        return round(score, 2)  # Round to 2 decimal places
+        self._tt.store(cache_key, score)
+        return score
 
     def get_turn_info(self) -> str:
         """Returns a string describing the current game state."""
@@ -495,6 +734,26 @@ class Board:
         """Returns the last move made (start_hex, end_hex) or None if no moves made."""
         return self.moves_history[-1] if self.moves_history else None
 
+    def copy(self):
+        """Returns an independent copy of the board.
+
+        Pieces and hexes are immutable and shared, so only the containers
+        are copied; this is much cheaper than a recursive deepcopy.
+        """
+        clone = Board.__new__(Board)
+        clone.__dict__.update(self.__dict__)
+        clone.board = dict(self.board)
+        clone._king_positions = dict(self._king_positions)
+        clone._pieces_by_color = {color: set(hexes) for color, hexes in self._pieces_by_color.items()}
+        clone.moves_history = list(self.moves_history)
+        clone._bitboards = list(self._bitboards)
+        clone._undo_stack = list(self._undo_stack)
+        clone._move_records = list(self._move_records)
+        return clone
+
+    def __deepcopy__(self, memo):
+        return self.copy()
+
     def __repr__(self):
         """Returns an unambiguous string representation of the board."""
         return (f"Board({len(self.board)} pieces, "
@@ -531,30 +790,33 @@ class Board:
         empty = EMPTY_CELL if use_unicode else ASCII_EMPTY_CELL
         cell_width = get_cell_width(use_unicode)
 
+        empty_cell = empty.center(cell_width)
+        empty_is_blank = not empty_cell.strip()
+        piece_cells = {}  # Formatted cell per piece code, built once per call
+        board = self.board
+
         # Create board content - iterate from top (black) to bottom (white)
-        for r in range(-self.BOARD_RADIUS, self.BOARD_RADIUS + 1):
+        for r, row_hexes in self.DISPLAY_ROWS:
             # Calculate row indentation
             indent = " " * abs(r) + " " * ROW_INDENT
-            row = []
-
-            for q in range(-self.BOARD_RADIUS, self.BOARD_RADIUS + 1):
-                s = -q - r
-                if not self.is_valid_hex(Hex(q, r, s)):
-                    continue
-                hex = Hex(q, r, s)
-                piece = self.get_piece(hex)
-                if piece:
-                    cell = format_piece(str(piece), use_unicode, use_colors)
-                    row.append(f"{cell:^{cell_width}}")
-                else:
-                    row.append(f"{empty:^{cell_width}}")
 
-            # Add hex borders
+            # Add hex borders, only between a cell and a visible cell before it
             hex_row = []
-            for i, cell in enumerate(row):
-                if i > 0 and row[i-1].strip():  # Only add vertical borders between valid cells
+            previous_visible = False
+            for hex in row_hexes:
+                if previous_visible:
                     hex_row.append("X")
-                hex_row.append(cell)
+                piece = board.get(hex)
+                if piece is not None:
+                    cell = piece_cells.get(piece.code)
+                    if cell is None:
+                        cell = piece_cells[piece.code] = \
+                            format_piece(str(piece), use_unicode, use_colors).center(cell_width)
+                    hex_row.append(cell)
+                    previous_visible = True
+                else:
+                    hex_row.append(empty_cell)
+                    previous_visible = not empty_is_blank
 
             # Add coordinates if requested
             coord_suffix = f" r={r:2d}" if show_coords else ""
@@ -586,4 +848,7 @@ class Board:
         piece_str = piece.type if piece.type != "P" else ""
         capture_str = "x" if self.is_occupied(end_hex) else ""
         end_pos_str = f"{self.q_labels[end_hex.q]}{self.r_labels[end_hex.r]}"
-        return f"{piece_str}{capture_str}{end_pos_str}"
\ No newline at end of file
+        return f"{piece_str}{capture_str}{end_pos_str}"
+
+
+Board._build_tables()
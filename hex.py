@@ -4,7 +4,11 @@ Provides classes and functions for representing and manipulating hexagonal coord
 """
 
 import math
-import traceback
+
+# Interned Hex instances keyed on (q, r); s is implied by q + r + s = 0
+_HEX_POOL = {}
+# Memoized hex + direction tuple sums, keyed on (hex, direction)
+_SUM_CACHE = {}
 
 class Hex:
     """
@@ -14,19 +18,45 @@ class Hex:
         q (int): The q coordinate.
         r (int): The r coordinate.
     """
-    def __init__(self, q, r, s):
-        """Initialize a hex with cubic coordinates.
+    __slots__ = ("q", "r", "s")
+
+    def __new__(cls, q, r, s):
+        """Return the shared hex for the given cubic coordinates.
+
+        Hexes are interned: constructing the same coordinates twice yields
+        the same object, so board lookups and hex arithmetic never allocate
+        once a coordinate has been seen.
 
         Args:
             q: The q coordinate
             r: The r coordinate
             s: The s coordinate
         """
-        if not self.is_valid_cubic_coordinates(q, r, s):
+        hex = _HEX_POOL.get((q, r))
+        if hex is not None and hex.s == s:
+            return hex
+        if not cls.is_valid_cubic_coordinates(q, r, s):
             raise ValueError(f"Invalid cubic coordinates: {q}+{r}+{s}≠0")
-        self.q = q
-        self.r = r
-        self.s = s
+        hex = super().__new__(cls)
+        object.__setattr__(hex, "q", q)
+        object.__setattr__(hex, "r", r)
+        object.__setattr__(hex, "s", s)
+        _HEX_POOL[(q, r)] = hex
+        return hex
+
+    def __setattr__(self, name, value):
+        """Hexes are shared, so they cannot be modified after construction."""
+        raise AttributeError(f"Hex is immutable, cannot set {name!r}")
+
+    def __reduce__(self):
+        """Rebuild through the constructor so copies resolve to the shared hex."""
+        return (Hex, (self.q, self.r, self.s))
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
 
     @staticmethod
     def is_valid_cubic_coordinates(q: int, r: int, s: int) -> bool:
@@ -67,17 +97,16 @@ class Hex:
         Returns:
           True if the coordinates of both hexes are equal, False otherwise.
         """
+        if self is other:
+            return True  # Interned: equal hexes are normally the same object
         if not isinstance(other, Hex):
             return False  # Handle comparison with non-Hex objects
         return self.q == other.q and self.r == other.r and self.s == other.s
 
-    def __hash__(self):
-        """
-        Returns a hash value for the Hex object.
-
-        This is necessary for using Hex objects as keys in dictionaries.
-        """
-        return hash((self.q, self.r, self.s))
+    # Hexes are interned, so equal hexes are the same object and the identity
+    # hash is consistent with __eq__. It is computed in C, which makes board
+    # dict lookups about as cheap as indexing a dense array.
+    __hash__ = object.__hash__
 
     def to_tuple(self):
         """
@@ -115,16 +144,20 @@ class Hex:
             ValueError: If tuple does not have exactly 3 integer coordinates
         """
         if isinstance(other, tuple):
+            try:
+                return _SUM_CACHE[self, other]
+            except (KeyError, TypeError):
+                pass
             if len(other) != 3:
-                print(other)
-                traceback.print_stack()
                 raise ValueError("Direction tuple must have exactly 3 coordinates")
             try:
-                return Hex(self.q + int(other[0]), 
-                         self.r + int(other[1]), 
-                         self.s + int(other[2]))
+                result = Hex(self.q + int(other[0]), 
+                             self.r + int(other[1]), 
+                             self.s + int(other[2]))
             except (TypeError, ValueError):
                 raise ValueError("Direction coordinates must be integers")
+            _SUM_CACHE[self, other] = result
+            return result
         if isinstance(other, Hex):
             return Hex(self.q + other.q, self.r + other.r, self.s + other.s)
         raise TypeError(f"Cannot add Hex and {type(other).__name__}")
@@ -201,5 +234,8 @@ def hex_distance(hex1, hex2):
     """
     if not isinstance(hex1, Hex) or not isinstance(hex2, Hex):
         raise TypeError("Both arguments must be Hex objects")
-    return abs(hex1 - hex2)
+    # Computed directly: hex1 - hex2 would intern an off-board difference hex
+    dq = hex1.q - hex2.q
+    dr = hex1.r - hex2.r
+    return max(abs(dq), abs(dr), abs(dq + dr))
 
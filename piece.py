@@ -1,8 +1,20 @@
-from dataclasses import dataclass, replace
+from dataclasses import dataclass, field
 from typing import Literal
 from hex import Hex
 
-@dataclass(frozen=True)
+# Small-int piece encoding: bits 0-2 hold the type index, bit 3 the color
+PIECE_TYPES = ("P", "N", "B", "R", "Q", "K")
+TYPE_INDEX = {piece_type: index for index, piece_type in enumerate(PIECE_TYPES)}
+BLACK_BIT = 8
+
+# Interned pieces keyed on (type, color, position, has_moved), see make_piece()
+_PIECE_POOL = {}
+
+def piece_code(piece_type: str, color: str) -> int:
+    """Return the small-int code for a piece type and color (e.g. 'N', 'black' -> 9)."""
+    return TYPE_INDEX[piece_type] | (BLACK_BIT if color == "black" else 0)
+
+@dataclass(frozen=True, slots=True)
 class Piece:
     """
     Represents an immutable chess piece.
@@ -12,24 +24,41 @@ class Piece:
         color: The piece color (white or black)
         position: Current position on the board
         has_moved: Whether the piece has moved (for pawns and castling)
+        code: Small-int encoding of type and color, see piece_code()
     """
     type: Literal["P", "R", "N", "B", "Q", "K"]
     color: Literal["white", "black"]
     position: Hex
     has_moved: bool = False
+    code: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "code", piece_code(self.type, self.color))
 
     def move(self, new_position: Hex) -> 'Piece':
-        """Create a new piece at the new position with has_moved=True.
+        """Return the piece at the new position with has_moved=True.
         
         Args:
             new_position: The new position for the piece
             
         Returns:
-            A new Piece instance at the new position with has_moved=True
+            The shared Piece instance at the new position with has_moved=True
         """
         # print(f"Moving {self.color} {self.type} from {self.position} to {new_position}")
-        return replace(self, position=new_position, has_moved=True)
+        return make_piece(self.type, self.color, new_position, True)
 
     def __str__(self) -> str:
         """Return the piece's string representation (e.g., 'wP' for white pawn)."""
         return f"{self.color[0]}{self.type}"
+
+def make_piece(piece_type: str, color: str, position: Hex, has_moved: bool = False) -> Piece:
+    """Return the shared Piece for the given fields, creating it on first use.
+
+    Pieces are immutable, so equal pieces can be the same object; moving a
+    piece back and forth then never allocates.
+    """
+    key = (piece_type, color, position, has_moved)
+    piece = _PIECE_POOL.get(key)
+    if piece is None:
+        piece = _PIECE_POOL[key] = Piece(piece_type, color, position, has_moved)
+    return piece
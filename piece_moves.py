@@ -1,25 +1,81 @@
 from hex import Hex, hex_directions
-from piece import Piece  # Ensure to import Piece class
 import math
 
+# Knight offsets: two steps in one direction (d1), then one step at a
+# 60-degree angle (d2, a neighbouring direction of d1)
+KNIGHT_OFFSETS = tuple(
+    tuple(2 * a + b for a, b in zip(d1, hex_directions[d2_index]))
+    for d1_index, d1 in enumerate(hex_directions)
+    for d2_index in ((d1_index + 1) % 6, (d1_index - 1) % 6)
+)
+
+# Diagonal directions: the sum of each pair of neighbouring primary directions
+BISHOP_DIRECTION_VECTORS = tuple(
+    tuple(a + b for a, b in zip(d1, hex_directions[(index + 1) % 6]))
+    for index, d1 in enumerate(hex_directions)
+)
+
+# Direction a pawn advances in, by pawn color
+PAWN_FORWARD_DIRECTIONS = {
+    "white": hex_directions[1],  # N
+    "black": hex_directions[4],  # S
+}
+
+# Diagonal-forward directions a pawn captures in, by pawn color
+PAWN_CAPTURE_DIRECTIONS = {
+    "white": (hex_directions[0], hex_directions[2]),  # NE, NW
+    "black": (hex_directions[3], hex_directions[5]),  # SW, SE
+}
+
+def _step(board, piece, targets):
+    """Collects moves onto precomputed on-board target hexes.
+
+    Args:
+        board: The game board
+        piece: The knight or king to move
+        targets: On-board hexes from board.KNIGHT_TARGETS or board.NEIGHBORS
+
+    Returns:
+        list: Target hexes that are empty or hold an opponent piece
+    """
+    squares = board.board
+    moves = []
+    for move in targets:
+        target_piece = squares.get(move)
+        if target_piece is None or target_piece.color != piece.color:
+            moves.append(move)
+    return moves
+
+def _slide(board, piece, rays):
+    """Collects sliding moves along precomputed rays.
+
+    Each ray lists the on-board hexes in one direction ordered by distance,
+    so the board edge is simply the end of the ray.
+
+    Args:
+        board: The game board
+        piece: The sliding piece to move
+        rays: Rays from board.RAYS for the piece's position
+
+    Returns:
+        list: Valid destination hexes along the rays
+    """
+    squares = board.board
+    moves = []
+    for ray in rays:
+        for current in ray:
+            target = squares.get(current)
+            if target is not None:
+                if target.color != piece.color:
+                    moves.append(current)
+                break  # Blocked by a piece
+            moves.append(current)
+    return moves
+
 def get_bishop_moves(board, piece):
     """Gets all valid bishop moves along diagonals."""
     # print(f"Calculating bishop moves for piece at {piece.position}")  # Debug line
-    moves = set()
-    for direction in board.BISHOP_DIRECTIONS:
-        current = piece.position
-        while True:
-            current = current + direction
-            # print(f"Checking position {current} in direction {direction}")  # Debug line
-            if not board.is_valid_hex(current):
-                break
-            target = board.get_piece(current)
-            if target:
-                if target.color != piece.color:
-                    moves.add(current)
-                break
-            moves.add(current)
-    return moves
+    return _slide(board, piece, board.RAYS[piece.position][6:])
 
 def get_knight_moves(board, piece):
     """Calculate all valid moves for a knight.
@@ -32,20 +88,10 @@ def get_knight_moves(board, piece):
         piece: The knight piece to move
         
     Returns:
-        set: Valid destination hexes for the knight
+        list: Valid destination hexes for the knight
     """
     # print(f"Calculating knight moves for piece at {piece.position}")  # Debug line
-    moves = set()
-    for d1_index, d1 in enumerate(hex_directions):
-        for d2_index in [(d1_index + 1) % 6, (d1_index - 1) % 6]:
-            d2 = hex_directions[d2_index]
-            move = piece.position + d1 + d1 + d2  # Two steps in d1 direction, one step in d2 direction
-            # print(f"Checking move {move} from {piece.position} using directions {d1} and {d2}")  # Debug line
-            if board.is_valid_hex(move):
-                target_piece = board.get_piece(move)
-                if target_piece is None or target_piece.color != piece.color:
-                    moves.add(move)
-    return moves
+    return _step(board, piece, board.KNIGHT_TARGETS[piece.position])
 
 def get_rook_moves(board, piece):
     """Calculate all valid moves for a rook.
@@ -58,24 +104,10 @@ def get_rook_moves(board, piece):
         piece: The rook piece to move
         
     Returns:
-        set: Valid destination hexes for the rook
+        list: Valid destination hexes for the rook
     """
     # print(f"Calculating rook moves for piece at {piece.position}")  # Debug line
-    moves = set()
-    for direction in hex_directions:
-        current = piece.position
-        while True:
-            current = current + direction  # Using __add__ instead of hex_add
-            # print(f"Checking position {current} in direction {direction}")  # Debug line
-            if not board.is_valid_hex(current):
-                break
-            target = board.get_piece(current)
-            if target:
-                if target.color != piece.color:
-                    moves.add(current)
-                break  # Blocked by a piece
-            moves.add(current)
-    return moves
+    return _slide(board, piece, board.RAYS[piece.position][:6])
 
 def get_queen_moves(board, piece):
     """Calculate all valid moves for a queen.
@@ -87,10 +119,10 @@ def get_queen_moves(board, piece):
         piece: The queen piece to move
         
     Returns:
-        set: Valid destination hexes for the queen
+        list: Valid destination hexes for the queen
     """
     # print(f"Calculating queen moves for piece at {piece.position}")  # Debug line
-    return get_rook_moves(board, piece) | get_bishop_moves(board, piece)
+    return _slide(board, piece, board.RAYS[piece.position])  # Rook rays, then bishop rays
 
 def get_king_moves(board, piece):
     """Calculate all valid moves for a king.
@@ -102,18 +134,10 @@ def get_king_moves(board, piece):
         piece: The king piece to move
         
     Returns:
-        set: Valid destination hexes for the king
+        list: Valid destination hexes for the king
     """
     # print(f"Calculating king moves for piece at {piece.position}")  # Debug line
-    moves = set()
-    for direction in hex_directions:
-        move = piece.position + direction  # Using __add__
-        # print(f"Checking move {move} from {piece.position} using direction {direction}")  # Debug line
-        if board.is_valid_hex(move):
-            target_piece = board.get_piece(move)
-            if target_piece is None or target_piece.color != piece.color:
-                moves.add(move)
-    return moves
+    return _step(board, piece, board.NEIGHBORS[piece.position])
 
 def get_pawn_moves(board, piece):
     """Calculate all valid moves for a pawn.
@@ -126,43 +150,33 @@ def get_pawn_moves(board, piece):
         piece: The pawn piece to move
         
     Returns:
-        set: Valid destination hexes for the pawn
+        list: Valid destination hexes for the pawn
     """
     # print(f"Calculating pawn moves for piece at {piece.position}")  # Debug line
-    moves = set()
-    forward = hex_directions[1] if piece.color == "white" else hex_directions[4]
-    one_step = piece.position + forward  # Using __add__
-    # print(f"Checking one step move {one_step} from {piece.position} using direction {forward}")  # Debug line
+    squares = board.board
+    moves = []
+    pushes = board.PAWN_PUSHES[piece.color][piece.position]  # On-board only, nearest first
 
-    if board.is_valid_hex(one_step) and not board.is_occupied(one_step):
-        moves.add(one_step)
+    if pushes and pushes[0] not in squares:
+        moves.append(pushes[0])
 
         # Double first move
-        if not piece.has_moved:
-            two_step = one_step + forward  # Using __add__
-            # print(f"Checking two step move {two_step} from {one_step} using direction {forward}")  # Debug line
-            if board.is_valid_hex(two_step) and not board.is_occupied(two_step):
-                moves.add(two_step)
+        if not piece.has_moved and len(pushes) > 1 and pushes[1] not in squares:
+            moves.append(pushes[1])
 
     # Captures
-    capture_left = piece.position + (hex_directions[0] if piece.color == "white" else hex_directions[3])  # Using __add__
-    capture_right = piece.position + (hex_directions[2] if piece.color == "white" else hex_directions[5])  # Using __add__
-    # print(f"Checking capture moves {capture_left} and {capture_right} from {piece.position}")  # Debug line
-
-    for capture_move in [capture_left, capture_right]:
-        if board.is_valid_hex(capture_move) and board.is_occupied(capture_move) and board.get_piece(capture_move).color != piece.color:
-            moves.add(capture_move)
+    for capture_move in board.PAWN_CAPTURES[piece.color][piece.position]:
+        target = squares.get(capture_move)
+        if target is not None and target.color != piece.color:
+            moves.append(capture_move)
 
     return moves
 
 def promote_pawn(board, hex, new_type): # Now takes hex as argument
-    """Promotes a pawn to a new piece type at given hex."""
-    piece = board.get_piece(hex)
-    if piece is None or piece.type != "P":
-        raise ValueError("No pawn to promote at given hex")
+    """Promotes a pawn to a new piece type at given hex.
 
-    if new_type not in ("R", "N", "B", "Q"):
-        raise ValueError("Invalid promotion type")
-
-    board.board[hex] = Piece(new_type, piece.color, hex)  # Creates new piece object
+    Delegates to Board.promote_pawn so the position hash and bitboards
+    stay in sync with the board.
+    """
+    board.promote_pawn(hex, new_type)
 
@@ -6,15 +6,35 @@ from hex import Hex
 import random
 
 
+def reservoir_sample(items, k):
+    """Pick k items uniformly at random from an iterable in a single pass.
+
+    Uses reservoir sampling (Algorithm R), so the iterable is never
+    collected into a list.
+
+    Args:
+        items: Any iterable
+        k: Number of items to pick
+
+    Returns:
+        list: Up to k items, fewer if the iterable is shorter
+    """
+    sample = []
+    for index, item in enumerate(items):
+        if index < k:
+            sample.append(item)
+        else:
+            slot = random.randint(0, index)
+            if slot < k:
+                sample[slot] = item
+    return sample
+
 def get_random_valid_moves(board, num_moves=5):
     """Get a list of random valid moves from the current board state."""
-    valid_moves = []
-    for hex, piece in board.board.items():
-        if piece.color == board.current_player:
-            possible_moves = board.get_possible_moves(hex)
-            for move in possible_moves:
-                valid_moves.append((piece, hex, move))
-    return random.sample(valid_moves, min(num_moves, len(valid_moves)))
+    valid_moves = ((board.get_piece(hex), hex, move)
+                   for hex, possible_moves in board.get_all_possible_moves().items()
+                   for move in possible_moves)
+    return reservoir_sample(valid_moves, num_moves)
 
 def play_game(board):
     """Plays a game of hexagonal chess."""
@@ -2,8 +2,8 @@
 # pygame_main.py
 
 import pygame
+from functools import lru_cache
 from math import sqrt
-from copy import deepcopy
 from hex import Hex
 from board import Board
 from utils import format_piece, load_piece_images
@@ -28,6 +28,21 @@ BOARD_OFFSET_Y = WINDOW_HEIGHT // 2  # Center the board vertically
 MOVES_LIST_WIDTH = 400  # Width of the moves list panel (doubled)
 NEW_WINDOW_WIDTH = WINDOW_WIDTH + MOVES_LIST_WIDTH  # Remove space for score bar
 MOVES_LINE_HEIGHT = 24  # Height of each line in the moves list
+BOARD_OFFSET_X_RENDER = BOARD_OFFSET_X + MOVES_LIST_WIDTH  # Board center x, right of the moves list
+
+# Precomputed factors for hex_to_pixel and hex_corners
+_Q_TO_PX = HEX_SIDE * 1.5  # Pixels per q step along x
+_RS_TO_PY = HEX_HEIGHT * 0.5  # Pixels per unit of (r - s) along y
+_PX_TO_Q = 2 / 3 / HEX_SIDE  # Fractional q per pixel along x
+_PY_TO_R = (3 ** 0.5) / 3 / HEX_SIDE  # Fractional r per pixel along y
+_HEX_CORNER_OFFSETS = (  # Corner offsets from the center, E then clockwise on screen
+    (HEX_SIDE, 0),
+    (HEX_SIDE / 2, HEX_APOTHEM),
+    (-HEX_SIDE / 2, HEX_APOTHEM),
+    (-HEX_SIDE, 0),
+    (-HEX_SIDE / 2, -HEX_APOTHEM),
+    (HEX_SIDE / 2, -HEX_APOTHEM),
+)
 
 # Tile labels
 q_labels = {q: letter for q, letter in zip(range(-5, 6), string.ascii_uppercase[:11])}
@@ -72,27 +87,101 @@ row_label_positions = {
     "1": Hex(-1, -5, 6),
 }
 
+# Size of a pre-rendered tile surface, with room for the 1px border
+TILE_WIDTH = HEX_DIAGONAL + 2
+TILE_HEIGHT = int(HEX_HEIGHT) + 2
+TILE_CENTER = (TILE_WIDTH / 2, TILE_HEIGHT / 2)
+
+# Drawing position of every board hex, the shaded tile surfaces and the
+# static board background, see build_tile_cache()
+_TILE_CACHE = {}
+_TILE_SURFACES = {}
+_BACKGROUND = None
+
 class GameState:
     """Encapsulates the core game state."""
     def __init__(self):
         self.board = Board()
         self.selected_hex = None
         self.possible_moves = None
+        self.moves_panel = MovesPanel()
+        self.drawn_cells = {}  # {Hex: (piece, highlighted)} as currently on screen
+
+class MovesPanel:
+    """The move history panel on the left side of the screen.
+
+    The panel is kept on its own surface: moves are drawn onto it once, as
+    they are appended, and the score headers only when the scores change.
+    The scores are only evaluated when the move history changed, so
+    selection-only frames leave the panel alone.
+    """
+    HEADER_HEIGHT = 40  # Height of the score header strip above the moves
+
+    def __init__(self):
+        self.surface = pygame.Surface((MOVES_LIST_WIDTH + 2, int(WINDOW_HEIGHT)))
+        self.move_count = 0  # Number of moves already drawn onto the surface
+        self.scores = None  # (white_score, black_score) shown in the headers
+        self.clear()
+
+    def clear(self):
+        """Paint the empty panel background."""
+        self.surface.fill(WHITE)
+        pygame.draw.line(self.surface, BLACK, (MOVES_LIST_WIDTH, 0), (MOVES_LIST_WIDTH, WINDOW_HEIGHT), 2)
+        self.move_count = 0
+        self.scores = None
+
+    def draw(self, surface, board):
+        """Bring the panel up to date with the board and blit it onto surface.
+
+        Returns:
+            pygame.Rect: The screen area repainted, or None if nothing changed
+        """
+        moves = board.moves_history
+        if len(moves) < self.move_count:
+            self.clear()  # History was rewound, redraw it from the start
+        elif self.scores is not None and len(moves) == self.move_count:
+            return None  # No move made, so the scores are unchanged too
+
+        # Get scores for both players and round to 2 decimal places
+        scores = (round(board.evaluate_position_for("white"), 2),
+                  round(board.evaluate_position_for("black"), 2))
+        if scores != self.scores:
+            self.scores = scores
+            white_score, black_score = scores
+            self.surface.fill(WHITE, (0, 0, MOVES_LIST_WIDTH, self.HEADER_HEIGHT))
+
+            # Draw column headers with scores
+            white_header = render_text(f"White ({white_score:.2f})", 24, BLACK)
+            black_header = render_text(f"Black ({black_score:.2f})", 24, BLACK)
+            self.surface.blit(white_header, (10, 10))
+            self.surface.blit(black_header, (MOVES_LIST_WIDTH // 2 + 10, 10))
+
+        # Draw the new moves in three columns
+        for i in range(self.move_count, len(moves)):
+            move_str = moves[i][2]
+            y = self.HEADER_HEIGHT + (i // 2) * MOVES_LINE_HEIGHT
+            if i % 2 == 0:
+                move_num_text = render_text(f"{(i // 2) + 1}.", 24, BLACK)
+                self.surface.blit(move_num_text, (10, y))
+                move_text = render_text(move_str, 24, BLACK)
+                self.surface.blit(move_text, (50, y))
+            else:
+                move_text = render_text(move_str, 24, BLACK)
+                self.surface.blit(move_text, (MOVES_LIST_WIDTH // 2 + 50, y))
+        self.move_count = len(moves)
+        return surface.blit(self.surface, (0, 0))
 
 def hex_to_pixel(hex):
-    """Convert hex coordinates to pixel coordinates."""
-    x = HEX_SIDE * (hex.q * 3/2)
-    y = HEX_HEIGHT * (hex.r - hex.s) / 2
-    return (x + BOARD_OFFSET_X, y + BOARD_OFFSET_Y)
+    """Convert hex coordinates to screen pixel coordinates."""
+    return (_Q_TO_PX * hex.q + BOARD_OFFSET_X_RENDER, _RS_TO_PY * (hex.r - hex.s) + BOARD_OFFSET_Y)
 
 def pixel_to_hex(x, y):
-    """Convert pixel coordinates to hex coordinates."""
+    """Convert screen pixel coordinates to hex coordinates."""
     # Adjust x coordinate to account for moves list panel and score bar
-    x -= MOVES_LIST_WIDTH
-    x -= BOARD_OFFSET_X
+    x -= BOARD_OFFSET_X_RENDER
     y -= BOARD_OFFSET_Y
-    q = (2/3 * x) / HEX_SIDE
-    r = (-x / 3 + (3 ** 0.5) / 3 * y) / HEX_SIDE
+    q = _PX_TO_Q * x
+    r = _PY_TO_R * y - _PX_TO_Q * x / 2
     s = -q - r
 
     # Round q, r, s to the nearest integers
@@ -115,6 +204,81 @@ def pixel_to_hex(x, y):
 
     return Hex(rounded_q, rounded_r, rounded_s)
 
+def hex_corners(x, y, scale=1):
+    """Return the six corner points of a hexagon centered at (x, y)."""
+    return [(x + dx * scale, y + dy * scale) for dx, dy in _HEX_CORNER_OFFSETS]
+
+def build_tile_cache():
+    """Precompute the drawing position of every board hex and the tile art.
+
+    The board never moves on screen and every tile of a color looks the
+    same, so the 3D tiles are drawn once into _TILE_SURFACES, keyed by
+    (color_index, highlight), and draw_board only blits them. The empty
+    board with its coordinate labels is rendered once into _BACKGROUND.
+    Once a display mode is set, the surfaces are converted to its pixel
+    format.
+
+    _TILE_CACHE maps each hex, in drawing order (row by row, then by q), to
+    (center, topleft, color_index, label) in screen coordinates.
+    """
+    global _BACKGROUND
+    screen = pygame.display.get_surface()
+
+    _TILE_CACHE.clear()
+    for r, row_hexes in Board.DISPLAY_ROWS:
+        for hex in row_hexes:
+            x, y = hex_to_pixel(hex)
+            topleft = (round(x - TILE_CENTER[0]), round(y - TILE_CENTER[1]))
+            color_index = (hex.q + 2 * r) % 3
+            label = f"{q_labels[hex.q]}{r_labels[r]}"
+            _TILE_CACHE[hex] = ((x, y), topleft, color_index, label)
+
+    _TILE_SURFACES.clear()
+    for color_index, color in enumerate(COLORS):
+        for highlight in (False, True):
+            tile = pygame.Surface((TILE_WIDTH, TILE_HEIGHT), pygame.SRCALPHA)
+            draw_hexagon(tile, color, TILE_CENTER, highlight=highlight)
+            _TILE_SURFACES[color_index, highlight] = tile.convert_alpha() if screen else tile
+
+    size = screen.get_size() if screen else (int(NEW_WINDOW_WIDTH), int(WINDOW_HEIGHT))
+    background = pygame.Surface(size)
+    if screen:
+        background = background.convert()
+    background.fill(WHITE)
+    draw_hex_group(background, _TILE_CACHE, dict.fromkeys(_TILE_CACHE, (None, False)), None)
+
+    label_blits = []
+
+    # Draw row labels
+    for label, hex in row_label_positions.items():
+        label_text = render_text(label, 24, BLACK)
+        x, y = hex_to_pixel(hex)
+        label_blits.append((label_text, (x + HEX_SIDE // 2, y)))
+
+    # Draw column labels
+    for label, hex in column_label_positions.items():
+        label_text = render_text(label, 24, BLACK)
+        x, y = hex_to_pixel(hex)
+        label_blits.append((label_text, (x, y + HEX_HEIGHT // 2 + 10)))
+    background.blits(label_blits, doreturn=False)
+    _BACKGROUND = background
+
+@lru_cache(maxsize=None)
+def get_font(size):
+    """Return the default font at the given size, loading it only once."""
+    return pygame.font.SysFont(None, size)
+
+@lru_cache(maxsize=1024)
+def render_text(text, size, color):
+    """Render antialiased text, reusing the surface for repeated strings.
+
+    Board labels, piece names and move strings repeat from frame to frame,
+    so each distinct (text, size, color) is rasterized only once. Once a
+    display mode is set, the text is converted to its pixel format.
+    """
+    text_surface = get_font(size).render(text, True, color)
+    return text_surface.convert_alpha() if pygame.display.get_surface() else text_surface
+
 def mix_color(base_color, mix_color, mix_amount):
     """Mix a given amount of mix_color into base_color."""
     return tuple(
@@ -122,17 +286,10 @@ def mix_color(base_color, mix_color, mix_amount):
         for i in range(3)
     )
 
-def draw_hexagon(surface, color, hex, border_color=BLACK, border_width=1, text=None, text_color=WHITE, fill=True, highlight=False):
-    """Draw a hexagon at the given hex coordinates with optional text."""
-    x, y = hex_to_pixel(hex)
-    points = [
-        (x + HEX_SIDE / 1, y),
-        (x + HEX_SIDE / 2, y + HEX_APOTHEM),
-        (x - HEX_SIDE / 2, y + HEX_APOTHEM),
-        (x - HEX_SIDE / 1, y),
-        (x - HEX_SIDE / 2, y - HEX_APOTHEM),
-        (x + HEX_SIDE / 2, y - HEX_APOTHEM),
-    ]
+def draw_hexagon(surface, color, center, border_color=BLACK, border_width=1, fill=True, highlight=False):
+    """Draw a 3D-shaded hexagon centered at the given pixel position."""
+    x, y = center
+    points = hex_corners(x, y)
     
     if color is not None:
         # Define colors for highlights and shadows
@@ -168,121 +325,91 @@ def draw_hexagon(surface, color, hex, border_color=BLACK, border_width=1, text=N
 
     if fill:
         # Draw a slightly smaller hexagon with uniform fill on top
-        smaller_points = [
-            ((x + HEX_SIDE * RAISE3D / 1), y),
-            ((x + HEX_SIDE * RAISE3D / 2), (y + HEX_APOTHEM * RAISE3D)),
-            ((x - HEX_SIDE * RAISE3D / 2), (y + HEX_APOTHEM * RAISE3D)),
-            ((x - HEX_SIDE * RAISE3D / 1), y),
-            ((x - HEX_SIDE * RAISE3D / 2), (y - HEX_APOTHEM * RAISE3D)),
-            ((x + HEX_SIDE * RAISE3D / 2), (y - HEX_APOTHEM * RAISE3D)),
-        ]
+        smaller_points = hex_corners(x, y, RAISE3D)
         pygame.draw.polygon(surface, color, smaller_points, 0)
 
-    if text:
-        font = pygame.font.SysFont(None, 22)
-        text_surface = font.render(text, True, text_color)
-        text_rect = text_surface.get_rect(center=(x, y))
-        surface.blit(text_surface, text_rect)
+def draw_hex_group(surface, hexes, cells, piece_images):
+    """Draw the given hexes: their tiles first, then text and pieces on top.
+
+    Each layer is drawn with a single batched blits call. Highlighted hexes
+    get the highlighted tile and no text.
+
+    Args:
+        surface: The surface to draw on
+        hexes: The hexes to draw, in drawing order
+        cells: {Hex: (piece, highlighted)} describing what to draw
+        piece_images: Piece images indexed by Piece.code
+    """
+    tile_blits = []
+    content_blits = []
+    for hex in hexes:
+        center, topleft, color_index, label = _TILE_CACHE[hex]
+        piece, highlighted = cells[hex]
+        tile_blits.append((_TILE_SURFACES[color_index, highlighted], topleft))
+        if not highlighted:
+            text = str(piece) if piece else label
+            text_surface = render_text(text, 22, WHITE)
+            content_blits.append((text_surface, text_surface.get_rect(center=center)))
+
+        if piece:
+            piece_image = piece_images[piece.code]
+            content_blits.append((piece_image, piece_image.get_rect(center=center)))
+    surface.blits(tile_blits, doreturn=False)
+    surface.blits(content_blits, doreturn=False)
 
 def draw_board(surface, game_state, piece_images):
-    """Draw the entire board."""
+    """Draw the board, repainting only what changed since the previous call.
+
+    The first call copies the static background and draws the occupied and
+    highlighted hexes over it. After that only the hexes whose piece or
+    highlight changed are repainted, from the background plus their own
+    tile, text and piece, along with the moves panel when it changed.
+
+    Returns:
+        list: The pygame.Rect areas of the surface that were repainted
+    """
     board = game_state.board
     selected_hex = game_state.selected_hex
     possible_moves = game_state.possible_moves
+    drawn_cells = game_state.drawn_cells
+    full_draw = not drawn_cells
 
-    # Draw moves list first
-    draw_move_history(surface, board)
-    
-    # Offset all board drawing by MOVES_LIST_WIDTH
-    old_BOARD_OFFSET_X = BOARD_OFFSET_X
-    globals()['BOARD_OFFSET_X'] = BOARD_OFFSET_X + MOVES_LIST_WIDTH
-
-    # Draw the board
-    for r in range(-board.BOARD_RADIUS, board.BOARD_RADIUS + 1):
-        for q in range(-board.BOARD_RADIUS, board.BOARD_RADIUS + 1):
-            s = -q - r
-            hex = Hex(q, r, s)
-            if board.is_valid_hex(hex):
-                color_index = (q + 2 * r) % 3
-                color = COLORS[color_index]
-                piece = board.get_piece(hex)
-                text = str(piece) if piece else f"{q_labels[q]}{r_labels[r]}"
-                draw_hexagon(surface, color, hex, text=text)
-
-                if piece:
-                    piece_image = piece_images[str(piece)]
-                    piece_rect = piece_image.get_rect(center=hex_to_pixel(hex))
-                    surface.blit(piece_image, piece_rect)
-
-    font = pygame.font.SysFont(None, 24)
+    if full_draw:
+        surface.blit(_BACKGROUND, (0, 0))
 
-    # Draw row labels
-    for label, hex in board.row_label_positions.items():
-        label_text = font.render(label, True, BLACK)
-        x, y = hex_to_pixel(hex)
-        surface.blit(label_text, (x + HEX_SIDE // 2, y))
-
-    # Draw column labels
-    for label, hex in board.column_label_positions.items():
-        label_text = font.render(label, True, BLACK)
-        x, y = hex_to_pixel(hex)
-        surface.blit(label_text, (x, y + HEX_HEIGHT // 2 + 10))
+    # Draw moves list first
+    dirty_rects = []
+    panel_rect = game_state.moves_panel.draw(surface, board)
+    if panel_rect:
+        dirty_rects.append(panel_rect)
 
-    # Highlight selected hex
+    highlighted = set(possible_moves or ())
     if selected_hex:
-        color_index = (selected_hex.q + 2 * selected_hex.r) % 3
-        color = COLORS[color_index]
-        draw_hexagon(surface, color, hex=selected_hex, highlight=True)
-        piece = board.get_piece(selected_hex)
-        if piece:
-            piece_image = piece_images[str(piece)]
-            piece_rect = piece_image.get_rect(center=hex_to_pixel(selected_hex))
-            surface.blit(piece_image, piece_rect)
-
-    # Highlight possible moves
-    if possible_moves:
-        for move in possible_moves:
-            color_index = (move.q + 2 * move.r) % 3
-            color = COLORS[color_index]
-            draw_hexagon(surface, color, hex=move, highlight=True, border_width=1)
-            piece = board.get_piece(move)
-            if piece:
-                piece_image = piece_images[str(piece)]
-                piece_rect = piece_image.get_rect(center=hex_to_pixel(move))
-                surface.blit(piece_image, piece_rect)
-
-    # Restore original offset
-    globals()['BOARD_OFFSET_X'] = old_BOARD_OFFSET_X
-
-def draw_move_history(surface, board):
-    """Draw the move history in three columns on the left side of the screen."""
-    font = pygame.font.SysFont(None, 24)
-    moves = board.moves_history
-    
-    # Draw moves list background
-    pygame.draw.rect(surface, WHITE, (0, 0, MOVES_LIST_WIDTH, WINDOW_HEIGHT))
-    pygame.draw.line(surface, BLACK, (MOVES_LIST_WIDTH, 0), (MOVES_LIST_WIDTH, WINDOW_HEIGHT), 2)
-    
-    # Get scores for both players and round to 2 decimal places
-    white_score = round(board.evaluate_position_for("white"), 2)
-    black_score = round(board.evaluate_position_for("black"), 2)
-    
-    # Draw column headers with scores
-    white_header = font.render(f"White ({white_score:.2f})", True, BLACK)
-    black_header = font.render(f"Black ({black_score:.2f})", True, BLACK)
-    surface.blit(white_header, (10, 10))
-    surface.blit(black_header, (MOVES_LIST_WIDTH // 2 + 10, 10))
-    
-    # Draw moves in three columns
-    for i, (start, end, move_str) in enumerate(moves):
-        if i % 2 == 0:
-            move_num_text = font.render(f"{(i // 2) + 1}.", True, BLACK)
-            surface.blit(move_num_text, (10, 40 + (i // 2) * MOVES_LINE_HEIGHT))
-            move_text = font.render(move_str, True, BLACK)
-            surface.blit(move_text, (50, 40 + (i // 2) * MOVES_LINE_HEIGHT))
-        else:
-            move_text = font.render(move_str, True, BLACK)
-            surface.blit(move_text, (MOVES_LIST_WIDTH // 2 + 50, 40 + (i // 2) * MOVES_LINE_HEIGHT))
+        highlighted.add(selected_hex)
+    cells = {hex: (board.get_piece(hex), hex in highlighted) for hex in _TILE_CACHE}
+    empty = (None, False)  # Looks exactly like the background
+
+    if full_draw:
+        draw_hex_group(surface, [hex for hex in _TILE_CACHE if cells[hex] != empty], cells, piece_images)
+        dirty_rects = [surface.get_rect()]
+    else:
+        # Neighbouring tiles share their edges, so a changed hex is redrawn
+        # clipped to its tile, together with the neighbours overlapping it
+        # in drawing order
+        for hex in _TILE_CACHE:
+            if drawn_cells[hex] == cells[hex]:
+                continue
+            center, topleft, color_index, label = _TILE_CACHE[hex]
+            rect = _TILE_SURFACES[color_index, False].get_rect(topleft=topleft)
+            group = (hex,) + board.NEIGHBORS[hex]
+            surface.set_clip(rect)
+            surface.blit(_BACKGROUND, rect, rect)
+            draw_hex_group(surface, [h for h in _TILE_CACHE if h in group and cells[h] != empty],
+                           cells, piece_images)
+            dirty_rects.append(rect)
+        surface.set_clip(None)
+    drawn_cells.update(cells)
+    return dirty_rects
 
 def handle_mouse_button_down(game_state, mouse_pos):
     """Handle mouse button down events."""
@@ -300,19 +427,21 @@ def handle_mouse_button_down(game_state, mouse_pos):
     elif clicked_hex != selected_hex:
         try:
             if clicked_hex in possible_moves:
-                temp_board = deepcopy(board)
-                temp_board.move_piece(selected_hex, clicked_hex)
-                if not temp_board.is_check(board.current_player):
-                    board.move_piece(selected_hex, clicked_hex)
-                    if board.is_checkmate(board.current_player):
-                        winner = "black" if board.current_player == "white" else "white"
-                        print(board.display())  # Display the final board
-                        print(f"Checkmate! {winner} wins!")
-                        return None, None
+                # Make the move, then take it back if it leaves the mover in check
+                mover = board.current_player
+                board.move_piece(selected_hex, clicked_hex)
+                if not board.is_check(mover):
+                    # Only a side in check can be mated, so test check once
+                    # and look for escapes only when it is needed
                     if board.is_check(board.current_player):
-                        print("Check!")
+                        if board.is_checkmate(board.current_player):
+                            print(board.display())  # Display the final board
+                            print(f"Checkmate! {mover} wins!")
+                        else:
+                            print("Check!")
                     return None, None
                 else:
+                    board.undo_move()
                     print("You cannot put yourself in check")
                     return None, None
             else:
@@ -332,27 +461,31 @@ def main():
 
     # Load piece images
     piece_images = load_piece_images("images")
+    build_tile_cache()
 
     running = True
     redraw = True  # Flag to indicate if the screen needs to be redrawn
     while running:
-        for event in pygame.event.get():
+        if redraw:
+            pygame.display.update(draw_board(screen, game_state, piece_images))
+            redraw = False  # Reset redraw flag after drawing
+            clock.tick(30)  # Cap the redraw rate
+
+        # Sleep until something happens, then handle everything queued
+        for event in [pygame.event.wait()] + pygame.event.get():
             if event.type == pygame.QUIT:
                 running = False
+            if event.type == pygame.WINDOWEXPOSED:
+                pygame.display.update()  # Repaint the window from the screen surface
             if event.type == pygame.MOUSEBUTTONDOWN:
                 new_selected_hex, new_possible_moves = handle_mouse_button_down(game_state, pygame.mouse.get_pos())
-                if new_selected_hex != game_state.selected_hex or new_possible_moves != game_state.possible_moves:
-                    game_state.selected_hex, game_state.possible_moves = new_selected_hex, new_possible_moves
+                # Tuple comparison tries identity first, and a position's move
+                # sets are cached, so an unchanged selection compares in O(1)
+                selection = (new_selected_hex, new_possible_moves)
+                if selection != (game_state.selected_hex, game_state.possible_moves):
+                    game_state.selected_hex, game_state.possible_moves = selection
                     redraw = True  # Set redraw flag when there is a mouse event
 
-        if redraw:
-            screen.fill(WHITE)
-            draw_board(screen, game_state, piece_images)
-            pygame.display.flip()
-            redraw = False  # Reset redraw flag after drawing
-
-        clock.tick(30)
-
     pygame.quit()
 
 if __name__ == "__main__":
@@ -0,0 +1,60 @@
+# transposition.py
+"""
+Provides Zobrist hashing keys and a bounded transposition table for board positions.
+"""
+
+import random
+
+TT_MAX_ENTRIES = 1 << 18  # Upper bound on stored positions before eviction
+
+
+class ZobristKeys(dict):
+    """Maps hashable position features to random 64-bit keys.
+
+    Keys are generated lazily on first access, so any feature tuple such as
+    (hex, piece_type, color, has_moved) can be used without building the
+    full table up front.
+    """
+    def __init__(self, seed=0x5EED):
+        super().__init__()
+        self._rng = random.Random(seed)
+
+    def __missing__(self, feature):
+        key = self[feature] = self._rng.getrandbits(64)
+        return key
+
+
+ZOBRIST = ZobristKeys()
+ZOBRIST_SIDE = ZOBRIST["black_to_move"]  # XOR-ed in while black is to move
+
+
+class TranspositionTable:
+    """
+    A bounded cache of position-dependent results keyed on Zobrist hashes.
+
+    When the table is full the oldest entry is evicted (FIFO).
+
+    Attributes:
+        max_entries (int): The maximum number of stored entries.
+    """
+    def __init__(self, max_entries=TT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries = {}
+
+    def get(self, key, default=None):
+        """Returns the entry stored under key, or default if absent."""
+        return self._entries.get(key, default)
+
+    def store(self, key, value):
+        """Stores value under key, evicting the oldest entry when full."""
+        entries = self._entries
+        if key not in entries and len(entries) >= self.max_entries:
+            del entries[next(iter(entries))]
+        entries[key] = value
+
+    def clear(self):
+        """Removes all entries."""
+        self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
@@ -1,6 +1,6 @@
 from typing import Dict, Optional
 import os
-import pygame
+from piece import PIECE_TYPES, BLACK_BIT, piece_code
 
 # Unicode chess piece symbols
 UNICODE_PIECES: Dict[str, str] = {
@@ -66,13 +66,17 @@ def get_cell_width(use_unicode: bool) -> int:
     """Returns appropriate cell width based on display mode."""
     return UNICODE_CELL_WIDTH if use_unicode else ASCII_CELL_WIDTH
 
+# Terminal capabilities, detected once at import
+_UNICODE_OK = 'UTF-8' in os.environ.get('LANG', '').upper()
+_ANSI_OK = os.environ.get('TERM') is not None
+
 def supports_unicode() -> bool:
     """Check if the terminal supports Unicode characters."""
-    return 'UTF-8' in os.environ.get('LANG', '').upper()
+    return _UNICODE_OK
 
 def supports_ansi() -> bool:
     """Check if the terminal supports ANSI escape codes."""
-    return os.environ.get('TERM') is not None
+    return _ANSI_OK
 
 def format_piece(piece_str: str, use_unicode: bool = True, use_colors: bool = True) -> str:
     """Format a piece string with Unicode symbols and/or colors.
@@ -92,8 +96,8 @@ def format_piece(piece_str: str, use_unicode: bool = True, use_colors: bool = Tr
         raise ValueError(f"Invalid piece string: {piece_str}")
 
     # Check terminal capabilities
-    use_unicode &= supports_unicode()
-    use_colors &= supports_ansi()
+    use_unicode &= _UNICODE_OK
+    use_colors &= _ANSI_OK
     
     # Get the piece symbol
     if use_unicode and piece_str in UNICODE_PIECES:
@@ -134,15 +138,28 @@ def create_border(width: int, style: str = "simple") -> str:
     return styles[style] * width
 
 def load_piece_images(image_folder):
-    """Load images for chess pieces from the specified folder."""
-    piece_images = {}
-    piece_types = ["P", "R", "N", "B", "Q", "K"]
-    colors = ["w", "b"]
-    for color in colors:
-        for piece in piece_types:
-            piece_str = f"{color}{piece}"
+    """Load images for chess pieces from the specified folder.
+
+    Once a display mode is set, the images are converted to the display's
+    pixel format so blitting them needs no per-blit conversion.
+
+    Args:
+        image_folder: Folder holding the images, named like "wP.png"
+
+    Returns:
+        list: The image surfaces indexed by Piece.code (unused codes hold None)
+    """
+    import pygame  # Only the GUI needs pygame; board and console play do not
+
+    piece_images = [None] * (BLACK_BIT + len(PIECE_TYPES))
+    convert = pygame.display.get_surface() is not None
+    for color in ("white", "black"):
+        for piece in PIECE_TYPES:
+            piece_str = f"{color[0]}{piece}"
             image_path = os.path.join(image_folder, f"{piece_str}.png")
-            if not os.path.exists(image_path):
-                raise FileNotFoundError(f"No file '{image_path}' found in working directory '{os.getcwd()}'.")
-            piece_images[piece_str] = pygame.image.load(image_path)
+            try:
+                image = pygame.image.load(image_path)
+            except FileNotFoundError as e:
+                raise FileNotFoundError(f"No file '{image_path}' found in working directory '{os.getcwd()}'.") from e
+            piece_images[piece_code(piece, color)] = image.convert_alpha() if convert else image
     return piece_images
\ No newline at end of file